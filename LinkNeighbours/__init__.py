@@ -1,6 +1,6 @@
 # import the main window object (mw) from aqt
 from anki.cards import Card
-from anki.models import NotetypeDict
+from anki.errors import NotFoundError
 from anki.notes import Note
 from aqt import mw, gui_hooks
 # import all the Qt GUI library
@@ -12,168 +12,301 @@ import json
 import os
 from enum import Flag, auto
 
+# orjson is considerably faster than the stdlib parser; fall back when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import internationalization
 from .i18n import tr, init_i18n
 
 # Global variable to store link rules
 link_rules = {}
 
+# Whether link_rules has been read from disk yet
+_rules_loaded = False
+
+# (mtime, size) of rules.json when it was last parsed
+_rules_stat: tuple[float, int] | None = None
+
+# Note type names keyed by model id, for the review shortcut handlers
+_model_name_cache: dict[int, str] = {}
+
+# Rules flattened into (source, target) field-index pairs per rule name,
+# plus the rules version they were compiled from
+_compiled_rules: dict[str, tuple[list[tuple[int, int]], list[tuple[int, int]]]] = {}
+_compiled_rules_version: int | None = None
+
 # Debug mode flag
 # DEBUG_MODE = True
 
 # Menu and submenu references
 link_neighbours_menu: QMenu | None = None
 
+# QActions for the saved rules currently in the menu, keyed by rule name
+_rule_actions: dict[str, QAction] = {}
 
-class LinkDirection(Flag):
-    FROM_LATTER_TO_FORMER = auto()
-    FROM_FORMER_TO_LATTER = auto()
-
+# Triggered handlers per rule name, reused if a rule's action is recreated
+_rule_handlers: dict = {}
 
-def get_notes_by_model(model_name: str, sort_field: str = None):
-    """
-    Get all notes of a specific model, sorted by a specified field
-    :param model_name: Name of the note model/type
-    :param sort_field: Field to sort by (if None, uses the model's sort field)
-    :return: List of notes
-    """
-    if not mw.col:
-        return []
+# Separator shown above the rule entries while any exist
+_rules_separator: QAction | None = None
 
-    # Find the model by name
-    model: NotetypeDict | None = mw.col.models.by_name(model_name)
-    if not model:
-        return []
+# Bumped whenever link_rules changes; lets menu rebuilds be skipped
+_rules_version = 0
 
-    # If no sort field is specified, try to use the model's sort field
-    if sort_field is None:
-        # Get the sort field index from the model
-        sort_field_idx = model.get('sortf', 0)  # Default to first field if no sort field specified
+# The rules version the menu was last built from
+_menu_rules_version: int | None = None
 
-        # Get the field name using the index
-        if 0 <= sort_field_idx < len(model['flds']):
-            sort_field = model['flds'][sort_field_idx]['name']
-        else:
-            sort_field = "crt"  # fallback to creation time if index is invalid
 
-    # Get all note IDs for this model
-    note_ids = mw.col.find_notes(f"mid:{model['id']}")
+class LinkDirection(Flag):
+    FROM_LATTER_TO_FORMER = auto()
+    FROM_FORMER_TO_LATTER = auto()
 
-    # Fetch the notes
-    notes = []
-    for nid in note_ids:
-        note = mw.col.get_note(nid)
-        notes.append(note)
 
-    # Sort notes by the specified field
-    if sort_field in [f['name'] for f in model['flds']]:
-        # If sort_field is a custom field, sort by that field
-        notes.sort(key=lambda x: x[sort_field].lower())
+def get_adjacent_nid(model_id: int, note_id: int, previous_or_next: str):
+    """
+    Get the id of the note next to the given note in sort-field order
+    :param model_id: Id of the note model/type
+    :param note_id: Id of the note whose neighbour is wanted
+    :param previous_or_next: 'previous' for the preceding note, 'next' for the following one
+    :return: The neighbouring note id, or None if there is none (or the note is gone)
+    """
+    row = mw.col.db.first("select sfld from notes where id = ?", note_id)
+    if row is None:
+        return None
+    sfld = row[0]
+
+    # Compare on (sfld, id) so notes with equal sort fields still have a
+    # stable order, and let the database return just the one neighbour
+    # sfld is stored as typed, so compare case-insensitively to keep the
+    # ordering the sorted(..., key=str.lower) implementation produced
+    if previous_or_next == 'previous':
+        return mw.col.db.scalar(
+            "select id from notes where mid = ? "
+            "and (sfld collate nocase, id) < (?, ?) "
+            "order by sfld collate nocase desc, id desc limit 1",
+            model_id, sfld, note_id)
     else:
-        # Default to sorting by creation time
-        notes.sort(key=lambda x: x.id)
+        return mw.col.db.scalar(
+            "select id from notes where mid = ? "
+            "and (sfld collate nocase, id) > (?, ?) "
+            "order by sfld collate nocase, id limit 1",
+            model_id, sfld, note_id)
+
 
-    return notes
+def _read_note_fields(note_id: int):
+    """
+    Read a note's field values straight from the database, in the note
+    type's field order, for notes that are only read during linking and
+    so don't need full Note hydration
+    :return: The list of field values, or None if the note is gone
+    """
+    flds = mw.col.db.scalar("select flds from notes where id = ?", note_id)
+    if flds is None:
+        return None
+    return flds.split("\x1f")
 
 
 def load_link_rules():
     """Load link rules from JSON file"""
-    global link_rules
+    global link_rules, _rules_loaded, _rules_stat, _rules_version
     current_folder = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(current_folder, "rules.json")
-    if os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            link_rules = json.load(f)
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        st = None
+    if st is not None:
+        # Skip the read and parse when the file hasn't changed on disk;
+        # one stat call covers existence, mtime and size
+        if _rules_loaded and (st.st_mtime, st.st_size) == _rules_stat:
+            return
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        link_rules = orjson.loads(data) if orjson else json.loads(data)
+        _rules_stat = (st.st_mtime, st.st_size)
+        _rules_version += 1
     else:
         link_rules = {}
+        _rules_stat = None
+        _rules_version += 1
+    _rules_loaded = True
+
+
+def _get_rules():
+    """Return the link rules, reading them from disk on first access"""
+    if not _rules_loaded:
+        load_link_rules()
+    return link_rules
 
 
 def save_link_rules():
     """Save link rules to JSON file"""
-    global link_rules
+    global link_rules, _rules_stat, _rules_version
+    _rules_version += 1
     current_folder = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(current_folder, "rules.json")
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(link_rules, f, ensure_ascii=False, indent=4)
-
-
-def link_notes(former_note, latter_note, rule_data, direction: LinkDirection):
+    if orjson:
+        data = orjson.dumps(link_rules, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(link_rules, ensure_ascii=False, indent=2).encode('utf-8')
+    # Write to a temp file and rename into place so a crash mid-write
+    # can't truncate the user's rules
+    tmp_path = config_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, config_path)
+    # The in-memory rules already match what was just written
+    st = os.stat(config_path)
+    _rules_stat = (st.st_mtime, st.st_size)
+
+
+def _get_compiled_rules(rule_name, rule_data):
+    """
+    Return the rules of a rule set compiled into (forward, backward) lists
+    of (source_index, target_index) pairs into the note type's field order
+    Rules change rarely but fire on every link action, so the list-of-dicts
+    structure is resolved once per rules version and reused
+    """
+    global _compiled_rules_version
+    if _compiled_rules_version != _rules_version:
+        _compiled_rules.clear()
+        _compiled_rules_version = _rules_version
+
+    compiled = _compiled_rules.get(rule_name)
+    if compiled is None:
+        model = mw.col.models.by_name(rule_data.get("note_type", "")) if mw.col else None
+        field_idx = {f['name']: i for i, f in enumerate(model['flds'])} if model else {}
+
+        def resolve(rules):
+            # Rules naming fields the note type no longer has are dropped
+            # here instead of being re-checked on every link
+            return [
+                (field_idx[r["source_field"]], field_idx[r["target_field"]])
+                for r in rules
+                if r["source_field"] in field_idx and r["target_field"] in field_idx
+            ]
+
+        compiled = (resolve(rule_data.get("forward_rules", [])),
+                    resolve(rule_data.get("backward_rules", [])))
+        _compiled_rules[rule_name] = compiled
+    return compiled
+
+
+def flush_linked_notes(notes):
+    """Write a batch of notes collected by link_notes in a single transaction"""
+    if notes:
+        mw.col.update_notes(notes)
+
+
+def link_notes(former_note, latter_note, rule_data, direction: LinkDirection, notes_to_save=None):
     """
     Link two consecutive notes the direction given
     If direction is from the former to the latter, then copy contents "backward" according to the backward rules
     If direction is from the latter to the former, then copy contents "forward" according to the forward rules
     Or have it bothways
+    :param notes_to_save: Optional list collecting the touched notes for a
+        later flush_linked_notes call, so bulk linking pays one commit
+        instead of one per pair; when omitted, changes are written here
     """
-    if LinkDirection.FROM_LATTER_TO_FORMER in direction and "forward_rules" in rule_data:
-        for rule in rule_data["forward_rules"]:
-            source_field = rule["source_field"]
-            target_field = rule["target_field"]
-
-            if source_field in latter_note and target_field in former_note:
-                former_note[target_field] = latter_note[source_field]
-
-        # Save the previous note with updated fields
-        mw.col.update_note(former_note)
-
-    if LinkDirection.FROM_FORMER_TO_LATTER in direction and "backward_rules" in rule_data:
-        for rule in rule_data["backward_rules"]:
-            source_field = rule["source_field"]
-            target_field = rule["target_field"]
-
-            if source_field in former_note and target_field in latter_note:
-                latter_note[target_field] = former_note[source_field]
-
-        # Save the next note with updated fields
-        mw.col.update_note(latter_note)
+    forward_pairs, backward_pairs = _get_compiled_rules(rule_data.get("note_type", ""), rule_data)
+
+    deferred = notes_to_save is not None
+    if not deferred:
+        notes_to_save = []
+
+    # Work on the positional field lists directly; the compiled index pairs
+    # are already validated against the note type's field order, so no
+    # per-rule name lookups or membership checks remain
+    former_values = former_note.fields if isinstance(former_note, Note) else former_note
+    latter_values = latter_note.fields if isinstance(latter_note, Note) else latter_note
+
+    if LinkDirection.FROM_LATTER_TO_FORMER in direction and forward_pairs:
+        changed = False
+        for source_idx, target_idx in forward_pairs:
+            value = latter_values[source_idx]
+            if former_values[target_idx] != value:
+                former_values[target_idx] = value
+                changed = True
+
+        # The previous note only needs saving if a field actually changed
+        if changed:
+            notes_to_save.append(former_note)
+
+    if LinkDirection.FROM_FORMER_TO_LATTER in direction and backward_pairs:
+        changed = False
+        for source_idx, target_idx in backward_pairs:
+            value = former_values[source_idx]
+            if latter_values[target_idx] != value:
+                latter_values[target_idx] = value
+                changed = True
+
+        # The next note only needs saving if a field actually changed
+        if changed:
+            notes_to_save.append(latter_note)
+
+    # Write both notes in one transaction instead of one commit each,
+    # unless the caller is collecting a larger batch
+    if not deferred and notes_to_save:
+        mw.col.update_notes(notes_to_save)
 
 
 def init_link_neighbours_menu():
     """Initialize the LinkNeighbours menu with submenu"""
     global link_neighbours_menu
 
-    # Remove existing menu if it exists
-    if link_neighbours_menu and link_neighbours_menu.menuAction() in mw.form.menuTools.actions():
-        mw.form.menuTools.removeAction(link_neighbours_menu.menuAction())
+    # Create the menu exactly once and keep it across re-inits, so its
+    # actions don't have to be torn down and rebuilt
+    if link_neighbours_menu is None:
+        link_neighbours_menu = QMenu(tr("link_neighbours_menu"), mw)
 
-    # Create main menu
-    link_neighbours_menu = QMenu(tr("link_neighbours_menu"), mw)
+        new_rule_action = QAction(tr("new_link_rule_set"), mw)
+        qconnect(new_rule_action.triggered, open_new_rule_dialog)
+        link_neighbours_menu.addAction(new_rule_action)
 
-    new_rule_action = QAction(tr("new_link_rule_set"), mw)
-    qconnect(new_rule_action.triggered, open_new_rule_dialog)
-    link_neighbours_menu.addAction(new_rule_action)
-
-    # Load and add saved rules to submenu
-    load_link_rules()
-
-    # Add separator only if there are saved rules
-    if link_rules:
-        link_neighbours_menu.addSeparator()
-
-    update_link_neighbours_menu()
+        # Defer reading the rules file until the menu is actually opened
+        qconnect(link_neighbours_menu.aboutToShow, update_link_neighbours_menu)
 
     # Add the main menu to tools menu
-    mw.form.menuTools.addMenu(link_neighbours_menu)
+    if link_neighbours_menu.menuAction() not in mw.form.menuTools.actions():
+        mw.form.menuTools.addMenu(link_neighbours_menu)
 
 
 def update_link_neighbours_menu():
     """Update the rules submenu with saved rules"""
-    global link_neighbours_menu, link_rules
+    global link_neighbours_menu, _menu_rules_version, _rules_separator
+
+    rules = _get_rules()
 
-    # Clear existing dynamic rules
-    actions_to_remove = []
-    for action in link_neighbours_menu.actions():
-        if hasattr(action, '_dynamic_rule'):
-            actions_to_remove.append(action)
+    # Nothing to do if the rules haven't changed since the last build
+    if _menu_rules_version == _rules_version:
+        return
+
+    # Remove actions whose rules are gone
+    for note_type_name in list(_rule_actions.keys() - rules.keys()):
+        link_neighbours_menu.removeAction(_rule_actions.pop(note_type_name))
 
-    for action in actions_to_remove:
-        link_neighbours_menu.removeAction(action)
+    # Show the separator only while there are saved rules
+    if rules and _rules_separator is None:
+        _rules_separator = link_neighbours_menu.addSeparator()
+    elif not rules and _rules_separator is not None:
+        link_neighbours_menu.removeAction(_rules_separator)
+        _rules_separator = None
 
-    # Add saved rules to submenu
-    for note_type_name, _ in link_rules.items():
+    # Add actions for new rules; existing ones are reused untouched
+    for note_type_name in [n for n in rules if n not in _rule_actions]:
         rule_action = QAction(note_type_name, mw)
-        rule_action._dynamic_rule = True
-        qconnect(rule_action.triggered, lambda _, n=note_type_name: open_rule_editor(n))
+        qconnect(rule_action.triggered,
+                 _rule_handlers.setdefault(note_type_name,
+                                           lambda _, n=note_type_name: open_rule_editor(n)))
         link_neighbours_menu.addAction(rule_action)
+        _rule_actions[note_type_name] = rule_action
+
+    _menu_rules_version = _rules_version
 
 
 class NoteTemplateSelectionDialog(QDialog):
@@ -182,7 +315,8 @@ class NoteTemplateSelectionDialog(QDialog):
     def __init__(self):
         QDialog.__init__(self, mw)
         self.selected_template = None
-        self.template_list = QListWidget()
+        self.template_list = QListView()
+        self.template_model = QStringListModel(self)
         self.confirm_button = QPushButton(tr("confirm_selection"))
         self.cancel_button = QPushButton(tr("cancel"))
         self.setup_ui()
@@ -216,22 +350,24 @@ class NoteTemplateSelectionDialog(QDialog):
         # Connect signals
         qconnect(self.confirm_button.clicked, self.confirm_selection)
         qconnect(self.cancel_button.clicked, self.reject)
-        qconnect(self.template_list.itemDoubleClicked, self.confirm_selection)
+        qconnect(self.template_list.doubleClicked, self.confirm_selection)
 
     def populate_templates(self):
         """Populate the template list with available note types"""
-        if mw.col:
-            note_types = mw.col.models.all()
-            for nt in note_types:
-                item = QListWidgetItem(nt['name'])
-                item.setData(Qt.ItemDataRole.UserRole, nt['id'])
-                self.template_list.addItem(item)
+        if not mw.col:
+            return
+
+        # A single string-list model backs the view, instead of one widget
+        # item per note type
+        self.template_model.setStringList([nt['name'] for nt in mw.col.models.all()])
+        self.template_list.setModel(self.template_model)
+        self.template_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
     def confirm_selection(self):
         """Confirm the selected template"""
-        selected_items = self.template_list.selectedItems()
-        if selected_items:
-            self.selected_template = selected_items[0].text()
+        index = self.template_list.currentIndex()
+        if index.isValid():
+            self.selected_template = index.data()
             self.accept()
 
 
@@ -252,6 +388,84 @@ def open_rule_editor(note_type_name):
     dialog.exec()
 
 
+class RuleTableModel(QAbstractTableModel):
+    """Table model holding the (source_field, target_field) pairs of one direction"""
+
+    def __init__(self, source_header, target_header, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.headers = [source_header, target_header]
+        self.rules = []  # list of [source_field, target_field]
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.rules)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.rules[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if index.isValid() and role == Qt.ItemDataRole.EditRole:
+            self.rules[index.row()][index.column()] = value
+            self.dataChanged.emit(index, index)
+            return True
+        return False
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def flags(self, index):
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsEditable)
+
+    def add_rule(self, source_field="", target_field=""):
+        """Append a rule row"""
+        row = len(self.rules)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rules.append([source_field, target_field])
+        self.endInsertRows()
+
+    def remove_rule(self, row):
+        """Remove the rule at the given row"""
+        if 0 <= row < len(self.rules):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.rules[row]
+            self.endRemoveRows()
+
+
+class FieldComboDelegate(QStyledItemDelegate):
+    """Delegate that edits a rule cell with a combo box of the note type's fields
+
+    A combo box is only created for the cell being edited, instead of two
+    live combo widgets per rule row.
+    """
+
+    def __init__(self, fields, parent=None):
+        QStyledItemDelegate.__init__(self, parent)
+        # One shared string model; editors reference it instead of each
+        # receiving its own copy of the field names
+        self.field_model = QStringListModel(fields, self)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self.field_model)
+        combo.setEditable(False)
+        return combo
+
+    def setEditorData(self, editor, index):
+        field_index = editor.findText(index.data() or "")
+        if field_index >= 0:
+            editor.setCurrentIndex(field_index)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
+
 class LinkRuleDialog(QDialog):
     """Dialog for creating/editing link rules"""
 
@@ -259,18 +473,17 @@ class LinkRuleDialog(QDialog):
         QDialog.__init__(self, mw)
         self.note_type_name = note_type_name
         self.template_name = template_name
-        self.note_type_combo = QComboBox()
+        self._fields_cache = {}
 
         self.note_type_display = QLabel()
 
-        self.forward_rules_layout = None
-        self.backward_rules_layout = None
-        self.add_forward_rule_btn = None
-        self.add_backward_rule_btn = None
-        self.forward_source_combos = []
-        self.forward_target_combos = []
-        self.backward_source_combos = []
-        self.backward_target_combos = []
+        fields = self.get_fields_for_template(template_name or note_type_name or "")
+        self.field_delegate = FieldComboDelegate(fields, self)
+
+        self.forward_model = RuleTableModel(tr("from_of_latter"), tr("to_of_former"), self)
+        self.backward_model = RuleTableModel(tr("from_of_former"), tr("to_of_latter"), self)
+        self.forward_view = None
+        self.backward_view = None
 
         self.forward_group = self.create_rules_area(tr("how_to_copy_contents_from_latter_to_former"),
                                                     LinkDirection.FROM_LATTER_TO_FORMER)
@@ -279,7 +492,7 @@ class LinkRuleDialog(QDialog):
         self.save_button = QPushButton(tr("save"))
         self.cancel_button = QPushButton(tr("cancel"))
         self.setup_ui()
-        if note_type_name and note_type_name in link_rules:
+        if note_type_name and note_type_name in _get_rules():
             self.load_rule_data(note_type_name)
 
     def setup_ui(self):
@@ -322,31 +535,34 @@ class LinkRuleDialog(QDialog):
         group = QGroupBox(title)
         group_layout = QVBoxLayout()
 
-        # Scroll area for rules
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-
-        # Add rule button
-        add_rule_btn = QPushButton(tr("add_rule"))
+        # Table view over the rule model; combo editors are created by the
+        # delegate only while a cell is being edited
+        view = QTableView()
+        view.setModel(self._get_model_by_direction(direction))
+        view.setItemDelegate(self.field_delegate)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        view.verticalHeader().setVisible(False)
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
 
-        # Store references to rule widgets
         if direction == LinkDirection.FROM_LATTER_TO_FORMER:  # forward
-            self.forward_rules_layout = scroll_layout
-            self.add_forward_rule_btn = add_rule_btn
+            self.forward_view = view
         elif direction == LinkDirection.FROM_FORMER_TO_LATTER:  # backward
-            self.backward_rules_layout = scroll_layout
-            self.add_backward_rule_btn = add_rule_btn
+            self.backward_view = view
         else:
             raise Exception(f"unexpected direction received: {direction}")
 
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-
-        group_layout.addWidget(scroll_area)
+        group_layout.addWidget(view)
 
+        # Add/remove rule buttons
+        add_rule_btn = QPushButton(tr("add_rule"))
+        remove_btn = QPushButton(tr("remove"))
         qconnect(add_rule_btn.clicked, lambda: self.add_rule_row(direction))
-        group_layout.addWidget(add_rule_btn)
+        qconnect(remove_btn.clicked, lambda: self.remove_selected_rule(direction))
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(add_rule_btn)
+        button_layout.addWidget(remove_btn)
+        group_layout.addLayout(button_layout)
 
         group.setLayout(group_layout)
 
@@ -354,155 +570,79 @@ class LinkRuleDialog(QDialog):
 
     def add_rule_row(self, direction: LinkDirection):
         """Add a new rule row for the specified direction (forward/backward)"""
-        if direction == LinkDirection.FROM_LATTER_TO_FORMER:  # forward
-            layout = self.forward_rules_layout
-            source, target = tr("from_of_latter"), tr("to_of_former")
-        elif direction == LinkDirection.FROM_FORMER_TO_LATTER:  # backward
-            layout = self.backward_rules_layout
-            source, target = tr("from_of_former"), tr("to_of_latter")
+        fields = self.get_fields_for_template(self.note_type_display.text())
+        default_field = fields[0] if fields else ""
+        self._get_model_by_direction(direction).add_rule(default_field, default_field)
+
+    def remove_selected_rule(self, direction: LinkDirection):
+        """Remove the currently selected rule row"""
+        if direction == LinkDirection.FROM_LATTER_TO_FORMER:
+            view = self.forward_view
+        elif direction == LinkDirection.FROM_FORMER_TO_LATTER:
+            view = self.backward_view
         else:
             raise Exception(f"unexpected direction received: {direction}")
 
-        # Create a horizontal layout for the rule
-        rule_layout = QHBoxLayout()
-
-        # 获取当前选中的模板的字段
-        current_template = self.note_type_display.text()
-        fields = self.get_fields_for_template(current_template)
-
-        # Source field combo
-        source_label = QLabel(source)
-        source_combo = QComboBox()
-        source_combo.addItems(fields)
-        source_combo.setEditable(False)
+        index = view.currentIndex()
+        if index.isValid():
+            self._get_model_by_direction(direction).remove_rule(index.row())
 
-        # Target field combo
-        target_label = QLabel(target)
-        target_combo = QComboBox()
-        target_combo.addItems(fields)
-        target_combo.setEditable(False)
+    def get_fields_for_template(self, template_name):
+        """Get fields for a specific template, cached for the dialog's lifetime"""
+        if template_name in self._fields_cache:
+            return self._fields_cache[template_name]
 
-        # Add to layout
-        rule_layout.addWidget(source_label)
-        rule_layout.addWidget(source_combo)
-        rule_layout.addWidget(target_label)
-        rule_layout.addWidget(target_combo)
-
-        # Remove button
-        remove_btn = QPushButton(tr("remove"))
-        qconnect(remove_btn.clicked, lambda: self.remove_rule(rule_layout, layout, source_combo, target_combo, direction))
-        rule_layout.addWidget(remove_btn)
-
-        # Add stretch to fill space
-        rule_layout.addStretch()
-
-        # Add to main layout
-        layout.addLayout(rule_layout)
-
-        # Store reference to combos to update later
-        if direction == LinkDirection.FROM_LATTER_TO_FORMER:  # forward
-            self.forward_source_combos.append(source_combo)
-            self.forward_target_combos.append(target_combo)
-        else:  # backward
-            self.backward_source_combos.append(source_combo)
-            self.backward_target_combos.append(target_combo)
-
-    @staticmethod
-    def get_fields_for_template(template_name):
-        """Get fields for a specific template"""
         if not mw.col:
             return []
 
-        note_types = mw.col.models.all()
-        for nt in note_types:
-            if nt['name'] == template_name:
-                return [f['name'] for f in nt['flds']]
-
-        return []
-
-    def remove_rule(self, rule_layout, parent_layout, source_combo, target_combo, direction: LinkDirection):
-        """Remove a rule field row"""
-        # Remove all widgets in the rule layout
-        for i in reversed(range(rule_layout.count())):
-            widget = rule_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        # Remove the layout from parent
-        parent_layout.removeItem(rule_layout)
-
-        if direction == LinkDirection.FROM_LATTER_TO_FORMER:
-            self.forward_source_combos.remove(source_combo)
-            self.forward_target_combos.remove(target_combo)
-        elif direction == LinkDirection.FROM_FORMER_TO_LATTER:
-            self.backward_source_combos.remove(source_combo)
-            self.backward_target_combos.remove(target_combo)
-        else:
-            raise Exception(f"unexpected direction received: {direction}")
-
+        # by_name is an indexed lookup, no need to scan models.all()
+        nt = mw.col.models.by_name(template_name)
+        fields = [f['name'] for f in nt['flds']] if nt else []
+        self._fields_cache[template_name] = fields
+        return fields
 
     def load_rule_data(self, rule_name):
         """Load existing rule data"""
-        if rule_name in link_rules:
-            rule_data = link_rules[rule_name]
+        rules = _get_rules()
+        if rule_name in rules:
+            rule_data = rules[rule_name]
 
             # Set the template in the display label
             self.note_type_display.setText(rule_data.get('note_type', ''))
 
-            # Process both forward and backward rules using a helper function
+            # Fill both direction models from the stored rules
             for (dirt_str, direction) in [('forward', LinkDirection.FROM_LATTER_TO_FORMER), ('backward', LinkDirection.FROM_FORMER_TO_LATTER)]:
-                rules = rule_data.get(f'{dirt_str}_rules', [])
-                for rule in rules:
-                    self.add_rule_row(direction)
-                    # Get the last added combos
-                    source_combos, target_combos = self._get_combos_by_direction(direction)
-                    if source_combos:  # 确保列表不为空
-                        source_combo = source_combos[-1]
-                        target_combo = target_combos[-1]
-
-                        source_index = source_combo.findText(rule.get('source_field', ''))
-                        if source_index >= 0:
-                            source_combo.setCurrentIndex(source_index)
-
-                        target_index = target_combo.findText(rule.get('target_field', ''))
-                        if target_index >= 0:
-                            target_combo.setCurrentIndex(target_index)
-
-    def _get_combos_by_direction(self, direction: LinkDirection):
-        """Helper method to get the appropriate combo lists based on direction"""
+                model = self._get_model_by_direction(direction)
+                for rule in rule_data.get(f'{dirt_str}_rules', []):
+                    model.add_rule(rule.get('source_field', ''), rule.get('target_field', ''))
+
+    def _get_model_by_direction(self, direction: LinkDirection):
+        """Helper method to get the appropriate rule model based on direction"""
         if direction == LinkDirection.FROM_LATTER_TO_FORMER:  # forward
-            return self.forward_source_combos, self.forward_target_combos
+            return self.forward_model
         else:  # backward
-            return self.backward_source_combos, self.backward_target_combos
+            return self.backward_model
 
     def save_rule(self):
         """Save the rule"""
-        global link_rules
+        rules = _get_rules()
 
         # 使用显示的模板名称作为note_type_name（如果是新建规则）
         if not self.note_type_name:
             self.note_type_name = self.note_type_display.text()
 
-        # Collect rule data from UI elements
-        forward_rules = []
-        for i in range(len(self.forward_source_combos)):
-            source_combo = self.forward_source_combos[i]
-            target_combo = self.forward_target_combos[i]
-            if source_combo.currentIndex() != -1 and target_combo.currentIndex() != -1:
-                forward_rules.append({
-                    "source_field": source_combo.currentText(),
-                    "target_field": target_combo.currentText()
-                })
-
-        backward_rules = []
-        for i in range(len(self.backward_source_combos)):
-            source_combo = self.backward_source_combos[i]
-            target_combo = self.backward_target_combos[i]
-            if source_combo.currentIndex() != -1 and target_combo.currentIndex() != -1:
-                backward_rules.append({
-                    "source_field": source_combo.currentText(),
-                    "target_field": target_combo.currentText()
-                })
+        # Collect rule data from the table models
+        forward_rules = [
+            {"source_field": source_field, "target_field": target_field}
+            for source_field, target_field in self.forward_model.rules
+            if source_field and target_field
+        ]
+
+        backward_rules = [
+            {"source_field": source_field, "target_field": target_field}
+            for source_field, target_field in self.backward_model.rules
+            if source_field and target_field
+        ]
 
         rule_data = {
             "note_type": self.note_type_display.text(),
@@ -510,7 +650,7 @@ class LinkRuleDialog(QDialog):
             "backward_rules": backward_rules
         }
 
-        link_rules[self.note_type_name] = rule_data
+        rules[self.note_type_name] = rule_data
         save_link_rules()
         update_link_neighbours_menu()
 
@@ -541,17 +681,6 @@ def setup_review_shortcuts():
 '''
 
 
-def find_index(notes, note: Note):
-    cur = f"{dict(note.items())}"
-    i = 0
-    for item in notes:
-        cmp = f"{dict(item.items())}"
-        if cmp == cur:
-            return i
-        i += 1
-    raise ValueError('index out of range')
-
-
 def link_with_adjacent_note(reviewer, previous_or_next, both_ways: bool = False):
     """
     Link current note with adjacent note (previous or next) in sequence
@@ -566,34 +695,65 @@ def link_with_adjacent_note(reviewer, previous_or_next, both_ways: bool = False)
     current_card: Card = reviewer.card
     current_note: Note = current_card.note()
 
-    # Determine the note type
-    model_name = current_note.note_type()['name']
+    # Determine the note type; models.get returns the cached model dict
+    # whereas note_type() builds a fresh copy per call, and the name is
+    # memoized so repeated shortcuts skip the lookup entirely
+    model_name = _model_name_cache.get(current_note.mid)
+    if model_name is None:
+        model_name = mw.col.models.get(current_note.mid)['name']
+        _model_name_cache[current_note.mid] = model_name
 
     # Check if we have rules for this note type
-    if model_name not in link_rules:
+    rules = _get_rules()
+    if model_name not in rules:
         showInfo(tr("no_link_rules_defined_for_note_type", note_type=model_name))
         return
 
-    rule_data = link_rules[model_name]
+    rule_data = rules[model_name]
 
-    # Get all notes of this type, sorted
-    all_notes = get_notes_by_model(model_name)
+    # Fetch just the neighbouring note id off the main thread so the
+    # reviewer stays responsive on large collections; the linking itself
+    # runs back on the main thread once the id arrives
+    def fetch_adjacent_nid():
+        return get_adjacent_nid(current_note.mid, current_note.id, previous_or_next)
 
-    # Find current note in the list
-    try:
-        current_index = find_index(all_notes, current_note)
-    except ValueError:
-        showInfo(tr("current_note_not_found_in_sorted_list"))
-        return
+    def on_adjacent_nid(future):
+        # The user may have moved on while the query ran
+        if reviewer.card is not current_card:
+            return
+        _finish_link_with_adjacent(
+            reviewer, current_note, model_name, rule_data,
+            previous_or_next, both_ways, future.result())
 
+    mw.taskman.run_in_background(fetch_adjacent_nid, on_adjacent_nid)
+
+
+def _finish_link_with_adjacent(reviewer, current_note, model_name, rule_data,
+                               previous_or_next, both_ways, adjacent_nid):
+    """
+    Main-thread tail of link_with_adjacent_note, run once the neighbour
+    lookup has finished
+    """
     # Process based on direction
     if previous_or_next == 'previous':
         # Check if there's a previous note
-        if current_index <= 0:
+        if adjacent_nid is None:
             showInfo(tr("no_previous_note_to_link_to"))
             return
 
-        adjacent_note = all_notes[current_index - 1]
+        # A one-way link only reads from the neighbour, so a plain field
+        # list avoids hydrating a Note that is never written
+        if both_ways:
+            try:
+                adjacent_note = mw.col.get_note(adjacent_nid)
+            except NotFoundError:
+                adjacent_note = None
+        else:
+            adjacent_note = _read_note_fields(adjacent_nid)
+        # The neighbour may have been deleted while the lookup ran
+        if adjacent_note is None:
+            showInfo(tr("no_previous_note_to_link_to"))
+            return
         direction = LinkDirection.FROM_FORMER_TO_LATTER
         if both_ways:
             direction |= LinkDirection.FROM_LATTER_TO_FORMER
@@ -602,11 +762,23 @@ def link_with_adjacent_note(reviewer, previous_or_next, both_ways: bool = False)
         tooltip(tr("linked_current_note_to_previous_note_using_rules", note_type=model_name))
     elif previous_or_next == 'next':
         # Check if there's a next note
-        if current_index >= len(all_notes) - 1:
+        if adjacent_nid is None:
             showInfo(tr("no_next_note_to_link_to"))
             return
 
-        adjacent_note = all_notes[current_index + 1]
+        # A one-way link only reads from the neighbour, so a plain field
+        # list avoids hydrating a Note that is never written
+        if both_ways:
+            try:
+                adjacent_note = mw.col.get_note(adjacent_nid)
+            except NotFoundError:
+                adjacent_note = None
+        else:
+            adjacent_note = _read_note_fields(adjacent_nid)
+        # The neighbour may have been deleted while the lookup ran
+        if adjacent_note is None:
+            showInfo(tr("no_next_note_to_link_to"))
+            return
         direction = LinkDirection.FROM_LATTER_TO_FORMER
         if both_ways:
             direction |= LinkDirection.FROM_FORMER_TO_LATTER
@@ -622,42 +794,66 @@ def setup_review_context_menu():
     """Setup context menu items for linking notes during review"""
     from aqt.qt import QAction
 
+    # Create the actions and their connections once; the hook below only
+    # appends them to the menu, so right-clicks allocate nothing
+    prev_action = QAction(tr("link_by_copying_from_previous_note"), mw)
+    prev_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'previous'))
+
+    next_action = QAction(tr("link_by_copying_from_next_note"), mw)
+    next_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'next'))
+
+    prev_bothways_action = QAction(tr("link_with_previous_note_bothways"), mw)
+    prev_bothways_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'previous', True))
+
+    next_bothways_action = QAction(tr("link_with_next_note_bothways"), mw)
+    next_bothways_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'next', True))
+
+    actions = (prev_action, next_action, prev_bothways_action, next_bothways_action)
+
     def on_webview_will_show_context_menu(webview, menu):
-        # Check if this is the main webview (review screen)
-        if hasattr(webview, "title") and webview.title == "main webview" and mw.state == "review":
+        # Only the review screen gets the linking entries
+        if mw.state == "review":
             # Add separator to distinguish our menu items
             menu.addSeparator()
+            for action in actions:
+                menu.addAction(action)
 
-            # Add "Link with Previous Note" action
-            prev_action = QAction(tr("link_by_copying_from_previous_note"), mw)
-            prev_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'previous'))
-            menu.addAction(prev_action)
+    # Register the hook
+    gui_hooks.webview_will_show_context_menu.append(on_webview_will_show_context_menu)
 
-            # Add "Link with Next Note" action
-            next_action = QAction(tr("link_by_copying_from_next_note"), mw)
-            next_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'next'))
-            menu.addAction(next_action)
 
-            prev_bothways_action = QAction(tr("link_with_previous_note_bothways"), mw)
-            prev_bothways_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'previous', True))
-            menu.addAction(prev_bothways_action)
+def _invalidate_caches(*_args):
+    """Drop caches derived from the collection after any operation"""
+    global _compiled_rules_version
+    _model_name_cache.clear()
+    # Field edits on a note type shift its field indices, so the compiled
+    # (source, target) pairs must be resolved again by name
+    _compiled_rules.clear()
+    _compiled_rules_version = None
 
-            next_bothways_action = QAction(tr("link_with_next_note_bothways"), mw)
-            next_bothways_action.triggered.connect(lambda: link_with_adjacent_note(mw.reviewer, 'next', True))
-            menu.addAction(next_bothways_action)
 
-    # Register the hook
-    gui_hooks.webview_will_show_context_menu.append(on_webview_will_show_context_menu)
+# Whether the one-time review hooks have been registered
+_addon_initialized = False
+
+
+def init_addon():
+    """Initialize the addon once the profile is open, off the startup path"""
+    global _addon_initialized
 
+    init_i18n()
 
-# def init_addon():
-init_i18n()
+    # (Re)build the Tools menu entry; safe to repeat per profile
+    init_link_neighbours_menu()
 
-# Initialize the menu when addon loads
-init_link_neighbours_menu()
+    # The review context menu hook must only be registered once
+    if not _addon_initialized:
+        setup_review_context_menu()
+        _addon_initialized = True
 
-# Setup context menu when addon loads
-setup_review_context_menu()
 
+# Defer all setup (including i18n and menu construction) until the profile
+# is open, so importing the addon does no I/O and doesn't touch mw.form
+gui_hooks.profile_did_open.append(init_addon)
 
-# gui_hooks.profile_did_open.append(init_addon)
+# Invalidate the collection-derived caches whenever an operation runs
+gui_hooks.operation_did_execute.append(_invalidate_caches)
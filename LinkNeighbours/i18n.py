@@ -7,6 +7,16 @@ from anki.lang import current_lang
 import os
 import json
 
+# orjson parses considerably faster than stdlib json; fall back when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed locale files keyed by (lang_code, mtime), so re-initialisation
+# (e.g. addon reloads) skips the disk read and parse
+_translations_cache: dict[tuple[str, float], dict] = {}
+
 
 class I18n:
     """
@@ -38,10 +48,16 @@ class I18n:
             translation_file = os.path.join(current_dir, "locale", f"{lang_code}.json")
             if os.path.exists(translation_file):
                 try:
-                    with open(translation_file, 'r', encoding='utf-8') as f:
-                        translations = json.load(f)
-                        self.translations.update(translations)
-                        break  # Successfully loaded translations
+                    # Reuse the parsed dict while the file is unchanged
+                    mtime = os.path.getmtime(translation_file)
+                    translations = _translations_cache.get((lang_code, mtime))
+                    if translations is None:
+                        with open(translation_file, 'rb') as f:
+                            data = f.read()
+                        translations = orjson.loads(data) if orjson else json.loads(data)
+                        _translations_cache[(lang_code, mtime)] = translations
+                    self.translations.update(translations)
+                    break  # Successfully loaded translations
                 except Exception as e:
                     print(f"Failed to load translations for {lang_code}: {e}")
         